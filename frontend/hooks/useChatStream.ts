@@ -57,19 +57,22 @@ export function useChatStream(
           const { value, done } = await reader.read();
           if (done) break;
 
-          const chunk = decoder.decode(value);
+          const chunk = decoder.decode(value, { stream: true });
           buffer += chunk;
 
-          // Process complete lines
-          const lines = buffer.split('\n');
-          buffer = lines.pop() || ''; // Keep incomplete line in buffer
-
-          for (const line of lines) {
-            if (line.startsWith('data: ')) {
-              const data = line.slice(6); // Remove 'data: ' prefix
-              if (data && data !== '[DONE]') {
-                setAssistant((prev) => prev + data);
-              }
+          // Process complete events (terminated by a blank line)
+          const events = buffer.split('\n\n');
+          buffer = events.pop() || ''; // Keep incomplete event in buffer
+
+          for (const event of events) {
+            // Multi-line payloads arrive as one 'data: ' field per line
+            const data = event
+              .split('\n')
+              .filter((line) => line.startsWith('data: '))
+              .map((line) => line.slice(6)) // Remove 'data: ' prefix
+              .join('\n');
+            if (data && data !== '[DONE]') {
+              setAssistant((prev) => prev + data);
             }
           }
         }
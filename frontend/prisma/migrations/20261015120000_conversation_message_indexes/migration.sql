@@ -0,0 +1,5 @@
+-- CreateIndex
+CREATE INDEX "ix_conv_user_created" ON "Conversation"("userId", "createdAt");
+
+-- CreateIndex
+CREATE INDEX "ix_message_conv_created" ON "Message"("conversationId", "createdAt");